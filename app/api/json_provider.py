@@ -0,0 +1,24 @@
+from flask.json.provider import JSONProvider
+import msgspec
+
+class MsgspecJSONProvider(JSONProvider):
+    """Flask JSON provider backed by msgspec's C encoder and decoder"""
+
+    _encoder = msgspec.json.Encoder()
+
+    def dumps(self, obj, **kwargs) -> str:
+        """Serialize data as a JSON string"""
+        return self._encoder.encode(obj).decode()
+
+    def loads(self, s, **kwargs):
+        """Deserialize data from a JSON string or bytes"""
+        try:
+            return msgspec.json.decode(s)
+        except msgspec.DecodeError as e:
+            # Flask and Werkzeug expect ValueError for malformed JSON
+            raise ValueError(str(e)) from e
+
+    def response(self, *args, **kwargs):
+        """Build a JSON response without round-tripping through str"""
+        obj = self._prepare_response_obj(args, kwargs)
+        return self._app.response_class(self._encoder.encode(obj), mimetype="application/json")
@@ -1,7 +1,6 @@
 from flask import Blueprint, request, jsonify, current_app
-from pydantic import ValidationError
-from .schemas import AnalysisRequestSchema, AnalysisResponseSchema, ErrorResponseSchema
-from ..use_cases.analyze_topic import AnalyzeTopicUseCase
+import msgspec
+from .schemas import AnalysisRequestSchema
 import logging
 
 # Configure logging
@@ -10,28 +9,28 @@ logger = logging.getLogger(__name__)
 
 api_bp = Blueprint('api', __name__)
 
+# Built once per process; msgspec validates while decoding
+_REQ_DEC = msgspec.json.Decoder(AnalysisRequestSchema)
+
 @api_bp.route('/analyze', methods=['POST'])
 def analyze_topic():
     """Start a new sentiment analysis job"""
     try:
         # Validate request data
-        request_data = request.get_json()
+        request_data = request.get_data()
         if not request_data:
-            return jsonify(ErrorResponseSchema(
-                error="Request body is required"
-            ).dict()), 400
+            return jsonify({"error": "Request body is required"}), 400
         
-        # Validate with Pydantic schema
+        # Decode and validate with msgspec schema
         try:
-            validated_data = AnalysisRequestSchema(**request_data)
-        except ValidationError as e:
-            return jsonify(ErrorResponseSchema(
-                error="Invalid request data",
-                details={"validation_errors": e.errors()}
-            ).dict()), 400
+            validated_data = _REQ_DEC.decode(request_data)
+        except msgspec.DecodeError as e:
+            return jsonify({
+                "error": "Invalid request data",
+                "details": {"validation_errors": [str(e)]}
+            }), 400
         
-        # Initialize use case (this would be injected in a real app)
-        use_case = AnalyzeTopicUseCase()
+        use_case = current_app.extensions['use_case']
         
         # Execute use case
         job_id = use_case.create_analysis_job(
@@ -44,28 +43,23 @@ def analyze_topic():
             "job_id": job_id,
             "status": "pending",
             "message": "Analysis job created successfully"
-        }), 202 
+        }), 202
         
     except Exception as e:
         logger.error(f"Error creating analysis job: {str(e)}")
-        return jsonify(ErrorResponseSchema(
-            error="Internal server error"
-        ).dict()), 500
+        return jsonify({"error": "Internal server error"}), 500
 
 @api_bp.route('/results/<job_id>', methods=['GET'])
 def get_analysis_results(job_id):
     """Get analysis results by job ID"""
     try:
-        # Initialize use case
-        use_case = AnalyzeTopicUseCase()
+        use_case = current_app.extensions['use_case']
         
         # Get analysis results
         analysis = use_case.get_analysis_results(job_id)
         
         if not analysis:
-            return jsonify(ErrorResponseSchema(
-                error="Analysis job not found"
-            ).dict()), 404
+            return jsonify({"error": "Analysis job not found"}), 404
         
         # Convert domain model to response schema
         response_data = {
@@ -98,9 +92,7 @@ def get_analysis_results(job_id):
         
     except Exception as e:
         logger.error(f"Error retrieving analysis results: {str(e)}")
-        return jsonify(ErrorResponseSchema(
-            error="Internal server error"
-        ).dict()), 500
+        return jsonify({"error": "Internal server error"}), 500
 
 @api_bp.route('/health', methods=['GET'])
 def health_check():
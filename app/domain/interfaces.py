@@ -1,5 +1,6 @@
 from abc import ABC, abstractmethod
-from typing import List, Optional
+from typing import List, Optional, Tuple
+import numpy as np
 from .models import Analysis, Tweet, SentimentResult
 
 class AnalysisRepository(ABC):
@@ -40,3 +41,8 @@ class SentimentService(ABC):
     def analyze_batch(self, texts: List[str]) -> List[tuple[str, float]]:
         """Analyze sentiment of multiple texts"""
         pass
+    
+    @abstractmethod
+    def analyze_batch_codes(self, texts: List[str]) -> Tuple[np.ndarray, np.ndarray]:
+        """Analyze multiple texts and return (uint8 label codes, float32 scores)"""
+        pass
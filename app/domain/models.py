@@ -10,7 +10,11 @@ class AnalysisStatus(Enum):
     COMPLETED = "completed"
     FAILED = "failed"
 
-@dataclass
+# Sentiment labels in code order; label codes are indexes into this tuple
+SENTIMENT_LABELS = ("positive", "negative", "neutral")
+SENTIMENT_LABEL_CODES = {label: code for code, label in enumerate(SENTIMENT_LABELS)}
+
+@dataclass(slots=True)
 class Tweet:
     """Domain model for a tweet"""
     id: str
@@ -20,7 +24,7 @@ class Tweet:
     sentiment_score: Optional[float] = None
     sentiment_label: Optional[str] = None
 
-@dataclass
+@dataclass(slots=True)
 class SentimentResult:
     """Domain model for sentiment analysis result"""
     positive_percentage: float
@@ -30,7 +34,7 @@ class SentimentResult:
     total_tweets: int
     analyzed_tweets: int
 
-@dataclass
+@dataclass(slots=True)
 class Analysis:
     """Domain model for sentiment analysis job"""
     job_id: str
@@ -42,7 +46,7 @@ class Analysis:
     error_message: Optional[str] = None
     tweets: Optional[List[Tweet]] = None
 
-@dataclass
+@dataclass(slots=True)
 class AnalysisRequest:
     """Domain model for analysis request"""
     topic: str
@@ -1,28 +1,39 @@
-from typing import List
-from .models import Tweet, SentimentResult, Analysis, AnalysisStatus
+from .models import SentimentResult, Analysis, AnalysisStatus, SENTIMENT_LABEL_CODES
 from .interfaces import TwitterRepository, SentimentService, AnalysisRepository
-from datetime import datetime
+from datetime import datetime, timezone
 import uuid
+import numpy as np
+
+def _utcnow() -> datetime:
+    """Current time as a timezone-aware UTC datetime"""
+    return datetime.now(timezone.utc)
 
 class SentimentCalculator:
     """Core business logic for sentiment analysis calculations"""
     
-    @staticmethod   
-    def calculate_sentiment_statistics(tweets: List[Tweet]) -> SentimentResult:
-        """Calculate sentiment statistics from analyzed tweets"""
-        if not tweets:
-            return SentimentResult(
-                positive_percentage=0.0,
-                negative_percentage=0.0,
-                neutral_percentage=0.0,
-                average_polarity=0.0,
-                total_tweets=0,
-                analyzed_tweets=0
-            )
-        
-        total_tweets = len(tweets)
-        analyzed_tweets = len([t for t in tweets if t.sentiment_label is not None])
-        
+    @staticmethod
+    def calculate_sentiment_statistics_arrays(labels: np.ndarray, scores: np.ndarray, total_tweets: int) -> SentimentResult:
+        """Calculate sentiment statistics from per-tweet label codes and scores"""
+        counts = np.bincount(labels, minlength=len(SENTIMENT_LABEL_CODES))
+        return SentimentCalculator._build_result(
+            total_tweets,
+            int(labels.size),
+            int(counts[SENTIMENT_LABEL_CODES['positive']]),
+            int(counts[SENTIMENT_LABEL_CODES['negative']]),
+            int(counts[SENTIMENT_LABEL_CODES['neutral']]),
+            float(scores.sum(dtype=np.float64))
+        )
+    
+    @staticmethod
+    def _build_result(
+        total_tweets: int,
+        analyzed_tweets: int,
+        positive_count: int,
+        negative_count: int,
+        neutral_count: int,
+        score_sum: float
+    ) -> SentimentResult:
+        """Turn label counts and the score sum into percentages and averages"""
         if analyzed_tweets == 0:
             return SentimentResult(
                 positive_percentage=0.0,
@@ -33,19 +44,13 @@ class SentimentCalculator:
                 analyzed_tweets=analyzed_tweets
             )
         
-        # Count sentiment labels
-        positive_count = len([t for t in tweets if t.sentiment_label == 'positive'])
-        negative_count = len([t for t in tweets if t.sentiment_label == 'negative'])
-        neutral_count = len([t for t in tweets if t.sentiment_label == 'neutral'])
-        
         # Calculate percentages
         positive_percentage = (positive_count / analyzed_tweets) * 100
         negative_percentage = (negative_count / analyzed_tweets) * 100
         neutral_percentage = (neutral_count / analyzed_tweets) * 100
         
         # Calculate average polarity (sentiment scores)
-        sentiment_scores = [t.sentiment_score for t in tweets if t.sentiment_score is not None]
-        average_polarity = sum(sentiment_scores) / len(sentiment_scores) if sentiment_scores else 0.0
+        average_polarity = score_sum / analyzed_tweets
         
         return SentimentResult(
             positive_percentage=positive_percentage,
@@ -71,13 +76,13 @@ class AnalysisOrchestrator:
     
     def create_analysis_job(self, topic: str, max_tweets: int = 10) -> str:
         """Create a new analysis job and return job ID"""
-        job_id = str(uuid.uuid4())
+        job_id = uuid.uuid4().hex
         
         analysis = Analysis(
             job_id=job_id,
             topic=topic,
             status=AnalysisStatus.PENDING,
-            created_at=datetime.utcnow()
+            created_at=_utcnow()
         )
         
         self.analysis_repo.create(analysis)
@@ -92,14 +97,11 @@ class AnalysisOrchestrator:
             # Step 1: Fetch tweets
             tweets = self.twitter_repo.search_tweets(topic, max_tweets)
             
-            # Step 2: Analyze sentiment for each tweet
-            for tweet in tweets:
-                label, score = self.sentiment_service.analyze_text(tweet.text)
-                tweet.sentiment_label = label
-                tweet.sentiment_score = score
+            # Step 2: Analyze sentiment for all tweets in one batch
+            labels, scores = self.sentiment_service.analyze_batch_codes([tweet.text for tweet in tweets])
             
             # Step 3: Calculate aggregated results
-            sentiment_result = SentimentCalculator.calculate_sentiment_statistics(tweets)
+            sentiment_result = SentimentCalculator.calculate_sentiment_statistics_arrays(labels, scores, len(tweets))
             
             # Step 4: Update analysis with results
             self.analysis_repo.update_status(
@@ -1,31 +1,90 @@
-from sqlalchemy import create_engine, Column, String, DateTime, JSON, Text
+from sqlalchemy import create_engine, func, text, update, Column, DateTime, Float, Index, Integer, String, Text
 from sqlalchemy.ext.declarative import declarative_base
-from sqlalchemy.orm import sessionmaker
-from sqlalchemy.dialects.postgresql import JSONB
-from datetime import datetime
+from sqlalchemy.orm import scoped_session, sessionmaker
+from collections import OrderedDict
+from datetime import datetime, timezone
 from typing import Optional
-import json
+import logging
+import os
+import msgspec
+import redis
 
 from ...domain.interfaces import AnalysisRepository
 from ...domain.models import Analysis, SentimentResult, AnalysisStatus
 from config import config
 
+logger = logging.getLogger(__name__)
+
 # Database setup
-engine = create_engine(config['default'].DATABASE_URL)
-SessionLocal = sessionmaker(autocommit=False, autoflush=False, bind=engine)
+engine = create_engine(
+    config['default'].DATABASE_URL,
+    pool_size=config['default'].DB_POOL_SIZE,
+    max_overflow=config['default'].DB_MAX_OVERFLOW,
+    pool_pre_ping=True,
+    pool_recycle=config['default'].DB_POOL_RECYCLE
+)
+# Thread-local sessions, released by SessionLocal.remove() at the end of each
+# Flask request / Celery task
+SessionLocal = scoped_session(sessionmaker(autocommit=False, autoflush=False, bind=engine))
 Base = declarative_base()
 
+# Statuses that stamp completed_at
+COMPLETED_OR_FAILED = frozenset({AnalysisStatus.COMPLETED.value, AnalysisStatus.FAILED.value})
+
+# Database-side UTC timestamp for naive DateTime columns
+UTC_NOW = func.timezone('UTC', func.now())
+
+def _naive_utc(value: Optional[datetime]) -> Optional[datetime]:
+    """Convert an aware datetime to naive UTC for the naive DateTime columns"""
+    if value is None or value.tzinfo is None:
+        return value
+    return value.astimezone(timezone.utc).replace(tzinfo=None)
+
+def _aware_utc(value: Optional[datetime]) -> Optional[datetime]:
+    """Mark a naive UTC datetime read from the database as UTC"""
+    if value is None:
+        return None
+    return value.replace(tzinfo=timezone.utc)
+
 class AnalysisModel(Base):
     """SQLAlchemy model for analysis table"""
     __tablename__ = "analyses"
+    __table_args__ = (
+        # Pending/processing jobs are a small, hot subset polled by monitoring
+        Index(
+            "ix_active_jobs",
+            "created_at",
+            postgresql_where=text("status IN ('pending', 'processing')")
+        ),
+    )
     
     job_id = Column(String, primary_key=True, index=True)
     topic = Column(String, nullable=False)
     status = Column(String, nullable=False)
-    created_at = Column(DateTime, default=datetime.utcnow)
+    created_at = Column(DateTime, default=UTC_NOW)
     completed_at = Column(DateTime, nullable=True)
-    result_data = Column(JSONB, nullable=True)
     error_message = Column(Text, nullable=True)
+    
+    # Result statistics (only set when completed)
+    positive_percentage = Column(Float, nullable=True)
+    negative_percentage = Column(Float, nullable=True)
+    neutral_percentage = Column(Float, nullable=True)
+    average_polarity = Column(Float, nullable=True)
+    total_tweets = Column(Integer, nullable=True)
+    analyzed_tweets = Column(Integer, nullable=True)
+
+# alembic.ini at the project root
+ALEMBIC_INI = os.path.join(os.path.dirname(os.path.abspath(__file__)), '..', '..', '..', 'alembic.ini')
+
+def init_db():
+    """Upgrade the schema to the latest migration; call once before starting workers"""
+    from alembic import command
+    from alembic.config import Config as AlembicConfig
+    
+    alembic_config = AlembicConfig(ALEMBIC_INI)
+    # Keep the application's logging configuration intact
+    alembic_config.attributes['configure_logger'] = False
+    command.upgrade(alembic_config, "head")
 
 class AnalysisDBRepository(AnalysisRepository):
     """Database implementation of AnalysisRepository"""
@@ -33,8 +92,12 @@ class AnalysisDBRepository(AnalysisRepository):
     def __init__(self):
         self.engine = engine
         self.SessionLocal = SessionLocal
-        # Create tables if they don't exist
-        Base.metadata.create_all(bind=self.engine)
+        self.config = config['default']
+        
+        # Completed/failed jobs never change again, so they are cached in a
+        # process-local LRU in front of a shared Redis cache
+        self.redis = redis.Redis.from_url(self.config.REDIS_URL)
+        self._local_cache = OrderedDict()
     
     def create(self, analysis: Analysis) -> Analysis:
         """Create a new analysis record"""
@@ -44,35 +107,34 @@ class AnalysisDBRepository(AnalysisRepository):
                 job_id=analysis.job_id,
                 topic=analysis.topic,
                 status=analysis.status.value,
-                created_at=analysis.created_at,
-                completed_at=analysis.completed_at,
-                error_message=analysis.error_message
+                created_at=_naive_utc(analysis.created_at),
+                completed_at=_naive_utc(analysis.completed_at),
+                error_message=analysis.error_message,
+                **self._result_columns(analysis.result)
             )
             
-            if analysis.result:
-                db_analysis.result_data = {
-                    "positive_percentage": analysis.result.positive_percentage,
-                    "negative_percentage": analysis.result.negative_percentage,
-                    "neutral_percentage": analysis.result.neutral_percentage,
-                    "average_polarity": analysis.result.average_polarity,
-                    "total_tweets": analysis.result.total_tweets,
-                    "analyzed_tweets": analysis.result.analyzed_tweets
-                }
-            
             db.add(db_analysis)
             db.commit()
-            db.refresh(db_analysis)
             
             return analysis
             
         except Exception as e:
             db.rollback()
             raise e
-        finally:
-            db.close()
     
     def get_by_id(self, job_id: str) -> Optional[Analysis]:
         """Retrieve analysis by job ID"""
+        cached = self._get_cached(job_id)
+        if cached is not None:
+            return cached
+        
+        analysis = self._load(job_id)
+        if analysis is not None and analysis.status.value in COMPLETED_OR_FAILED:
+            self._set_cached(analysis)
+        return analysis
+    
+    def _load(self, job_id: str) -> Optional[Analysis]:
+        """Load analysis from the database"""
         db = self.SessionLocal()
         try:
             db_analysis = db.query(AnalysisModel).filter(AnalysisModel.job_id == job_id).first()
@@ -82,57 +144,125 @@ class AnalysisDBRepository(AnalysisRepository):
             
             # Convert database model to domain model
             result = None
-            if db_analysis.result_data:
+            if db_analysis.total_tweets is not None:
                 result = SentimentResult(
-                    positive_percentage=db_analysis.result_data.get("positive_percentage", 0.0),
-                    negative_percentage=db_analysis.result_data.get("negative_percentage", 0.0),
-                    neutral_percentage=db_analysis.result_data.get("neutral_percentage", 0.0),
-                    average_polarity=db_analysis.result_data.get("average_polarity", 0.0),
-                    total_tweets=db_analysis.result_data.get("total_tweets", 0),
-                    analyzed_tweets=db_analysis.result_data.get("analyzed_tweets", 0)
+                    positive_percentage=db_analysis.positive_percentage,
+                    negative_percentage=db_analysis.negative_percentage,
+                    neutral_percentage=db_analysis.neutral_percentage,
+                    average_polarity=db_analysis.average_polarity,
+                    total_tweets=db_analysis.total_tweets,
+                    analyzed_tweets=db_analysis.analyzed_tweets
                 )
             
             return Analysis(
                 job_id=db_analysis.job_id,
                 topic=db_analysis.topic,
                 status=AnalysisStatus(db_analysis.status),
-                created_at=db_analysis.created_at,
-                completed_at=db_analysis.completed_at,
+                created_at=_aware_utc(db_analysis.created_at),
+                completed_at=_aware_utc(db_analysis.completed_at),
                 result=result,
                 error_message=db_analysis.error_message
             )
             
-        finally:
-            db.close()
+        except Exception as e:
+            db.rollback()
+            raise e
     
     def update_status(self, job_id: str, status: str, result: Optional[SentimentResult] = None, error_message: Optional[str] = None) -> bool:
         """Update analysis status and result"""
         db = self.SessionLocal()
         try:
-            db_analysis = db.query(AnalysisModel).filter(AnalysisModel.job_id == job_id).first()
+            values = {
+                "status": status,
+                "completed_at": UTC_NOW if status in COMPLETED_OR_FAILED else None,
+                "error_message": error_message
+            }
             
-            if not db_analysis:
-                return False
-            
-            db_analysis.status = status
-            db_analysis.completed_at = datetime.utcnow() if status in ["completed", "failed"] else None
-            db_analysis.error_message = error_message
+            values.update(self._result_columns(result))
             
-            if result:
-                db_analysis.result_data = {
-                    "positive_percentage": result.positive_percentage,
-                    "negative_percentage": result.negative_percentage,
-                    "neutral_percentage": result.neutral_percentage,
-                    "average_polarity": result.average_polarity,
-                    "total_tweets": result.total_tweets,
-                    "analyzed_tweets": result.analyzed_tweets
-                }
+            # Single UPDATE ... RETURNING round-trip instead of SELECT + UPDATE
+            updated_job_id = db.execute(
+                update(AnalysisModel)
+                .where(AnalysisModel.job_id == job_id)
+                .values(**values)
+                .returning(AnalysisModel.job_id)
+            ).scalar_one_or_none()
             
             db.commit()
-            return True
+            self._invalidate_cached(job_id)
+            return updated_job_id is not None
             
         except Exception as e:
             db.rollback()
             raise e
-        finally:
-            db.close()
+    
+    def _result_columns(self, result: Optional[SentimentResult]) -> dict:
+        """Map a sentiment result onto the analysis table's result columns"""
+        if not result:
+            return {}
+        return {
+            "positive_percentage": result.positive_percentage,
+            "negative_percentage": result.negative_percentage,
+            "neutral_percentage": result.neutral_percentage,
+            "average_polarity": result.average_polarity,
+            "total_tweets": result.total_tweets,
+            "analyzed_tweets": result.analyzed_tweets
+        }
+    
+    def _cache_key(self, job_id: str) -> str:
+        """Redis key for a cached analysis"""
+        return f"analysis:{job_id}"
+    
+    def _get_cached(self, job_id: str) -> Optional[Analysis]:
+        """Look up a terminal analysis in the local cache, then Redis"""
+        analysis = self._local_cache.get(job_id)
+        if analysis is not None:
+            self._local_cache.move_to_end(job_id)
+            return analysis
+        
+        try:
+            payload = self.redis.get(self._cache_key(job_id))
+        except redis.RedisError as e:
+            logger.warning(f"Analysis cache read failed for job {job_id}: {str(e)}")
+            return None
+        
+        if payload is None:
+            return None
+        
+        try:
+            analysis = msgspec.json.decode(payload, type=Analysis)
+        except msgspec.DecodeError as e:
+            # Written by an older Analysis shape; drop it and reload from the database
+            logger.warning(f"Discarding undecodable cached analysis for job {job_id}: {str(e)}")
+            self._invalidate_cached(job_id)
+            return None
+        
+        self._remember(analysis)
+        return analysis
+    
+    def _set_cached(self, analysis: Analysis) -> None:
+        """Store a terminal analysis in both cache tiers"""
+        self._remember(analysis)
+        try:
+            self.redis.setex(
+                self._cache_key(analysis.job_id),
+                self.config.ANALYSIS_CACHE_TTL,
+                msgspec.json.encode(analysis)
+            )
+        except redis.RedisError as e:
+            logger.warning(f"Analysis cache write failed for job {analysis.job_id}: {str(e)}")
+    
+    def _remember(self, analysis: Analysis) -> None:
+        """Add an analysis to the process-local LRU"""
+        self._local_cache[analysis.job_id] = analysis
+        self._local_cache.move_to_end(analysis.job_id)
+        if len(self._local_cache) > self.config.ANALYSIS_CACHE_SIZE:
+            self._local_cache.popitem(last=False)
+    
+    def _invalidate_cached(self, job_id: str) -> None:
+        """Drop a job from both cache tiers after its status changes"""
+        self._local_cache.pop(job_id, None)
+        try:
+            self.redis.delete(self._cache_key(job_id))
+        except redis.RedisError as e:
+            logger.warning(f"Analysis cache invalidation failed for job {job_id}: {str(e)}")
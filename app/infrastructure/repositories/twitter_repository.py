@@ -1,4 +1,6 @@
 import tweepy
+import requests
+from requests.adapters import HTTPAdapter
 from typing import List
 from datetime import datetime
 import re
@@ -12,6 +14,17 @@ from config import config
 
 logger = logging.getLogger(__name__)
 
+# Patterns used when cleaning topics and tweet text
+_TOPIC_RE = re.compile(r'[^\w\s]')
+_URL_RE = re.compile(r'http[s]?://\S+')
+_MENTION_RE = re.compile(r'@\w+')
+_HASHTAG_RE = re.compile(r'#(?=\w)')
+
+# Keep-alive connection pool shared by all clients in the process; retries are
+# left to the exponential backoff in search_tweets
+_HTTP_SESSION = requests.Session()
+_HTTP_SESSION.mount('https://', HTTPAdapter(pool_connections=20, pool_maxsize=50, max_retries=0))
+
 class TwitterRepositoryImpl(TwitterRepository):
     """Twitter API implementation using Tweepy with improved rate limiting"""
     
@@ -28,6 +41,7 @@ class TwitterRepositoryImpl(TwitterRepository):
             access_token_secret=self.config.TWITTER_ACCESS_TOKEN_SECRET,
             wait_on_rate_limit=False  # We'll handle rate limiting ourselves
         )
+        self.client.session = _HTTP_SESSION
         
         # Rate limiting configuration
         self.max_retries = 3
@@ -60,7 +74,7 @@ class TwitterRepositoryImpl(TwitterRepository):
                     cleaned_text = self._clean_tweet_text(tweet_data.text)
                     
                     # Skip tweets that are too short after cleaning
-                    if len(cleaned_text.strip()) < 10:
+                    if len(cleaned_text) < 10:
                         continue
                     
                     tweet = Tweet(
@@ -122,7 +136,7 @@ class TwitterRepositoryImpl(TwitterRepository):
     def _clean_topic(self, topic: str) -> str:
         """Clean and format topic for Twitter search"""
         # Remove special characters and format for search
-        clean_topic = re.sub(r'[^\w\s]', '', topic)
+        clean_topic = _TOPIC_RE.sub('', topic)
         clean_topic = clean_topic.strip()
         
         # Add quotes for exact phrase matching
@@ -131,18 +145,19 @@ class TwitterRepositoryImpl(TwitterRepository):
     def _clean_tweet_text(self, text: str) -> str:
         """Clean tweet text by removing URLs, mentions, and other noise"""
         # Remove URLs
-        text = re.sub(r'http[s]?://(?:[a-zA-Z]|[0-9]|[$-_@.&+]|[!*\\(\\),]|(?:%[0-9a-fA-F][0-9a-fA-F]))+', '', text)
+        if 'http' in text:
+            text = _URL_RE.sub('', text)
         
         # Remove mentions
-        text = re.sub(r'@\w+', '', text)
+        if '@' in text:
+            text = _MENTION_RE.sub('', text)
         
         # Remove hashtags (but keep the text)
-        text = re.sub(r'#(\w+)', r'\1', text)
-        
-        # Remove extra whitespace
-        text = re.sub(r'\s+', ' ', text)
+        if '#' in text:
+            text = _HASHTAG_RE.sub('', text)
         
-        # Remove RT (retweet indicator)
-        text = re.sub(r'^RT\s+', '', text)
+        # Remove extra whitespace and the RT (retweet indicator) in one pass
+        is_retweet = text.startswith('RT') and text[2:3].isspace()
+        text = ' '.join(text.split())
         
-        return text.strip()
+        return text[3:] if is_retweet else text
@@ -1,84 +1,162 @@
-from transformers import pipeline
+from transformers import AutoTokenizer, pipeline
+from collections import OrderedDict
 from typing import List, Tuple
 import logging
+import os
+import numpy as np
 import torch
-import threading
+import functools
 
 from ...domain.interfaces import SentimentService
+from ...domain.models import SENTIMENT_LABEL_CODES
 from config import config
 
 logger = logging.getLogger(__name__)
 
+# Settings are fixed for the life of the process
+_CFG = config['default']
+_MODEL = _CFG.SENTIMENT_MODEL_NAME
+_CACHE_SIZE = _CFG.SENTIMENT_CACHE_SIZE
+
+# Model output labels (lowercased) normalized to our expected format;
+# anything else is treated as neutral
+_LABEL_MAP = {
+    'positive': 'positive',
+    'pos': 'positive',
+    'label_2': 'positive',
+    'negative': 'negative',
+    'neg': 'negative',
+    'label_0': 'negative',
+    'neutral': 'neutral',
+    'label_1': 'neutral',
+}
+
+# Result used for texts that are too short or could not be analyzed
+_NEUTRAL = ("neutral", 0.5)
+
+def _logits_to_float(module, args, output):
+    """Cast logits to float32, since the pipeline converts them to numpy"""
+    output.logits = output.logits.float()
+    return output
+
 class MLSentimentService(SentimentService):
     """Machine Learning sentiment analysis service using Hugging Face transformers"""
     
-    _instance = None
-    _lock = threading.Lock()
-    _initialized = False
-    
-    def __new__(cls):
-        """Singleton pattern to ensure only one instance exists"""
-        if cls._instance is None:
-            with cls._lock:
-                if cls._instance is None:
-                    cls._instance = super(MLSentimentService, cls).__new__(cls)
-        return cls._instance
-    
     def __init__(self):
-        """Initialize the sentiment analysis pipeline only once"""
-        if not self._initialized:
-            with self._lock:
-                if not self._initialized:
-                    self._initialize_pipeline()
-                    self._initialized = True
+        """Initialize the sentiment analysis pipeline"""
+        self._initialize_pipeline()
     
     def _initialize_pipeline(self):
         """Initialize the sentiment analysis pipeline"""
-        self.config = config['default']
+        # Checked here rather than at import: the Celery parent imports this
+        # module before forking, and initializing CUDA there breaks it in the children
+        use_cuda = torch.cuda.is_available()
+        self.batch_size = _CFG.SENTIMENT_BATCH_SIZE or (32 if use_cuda else 8)
+        # LRU of stripped text -> (label, score); retweets and copy-pasted
+        # tweets repeat the same text many times
+        self._cache = OrderedDict()
+        # Set when the model runs in bfloat16 and needs CPU autocast
+        self.use_bf16 = False
         
         try:
-            logger.info(f"Initializing sentiment analysis model: {self.config.SENTIMENT_MODEL_NAME}")
+            logger.info(f"Initializing sentiment analysis model: {_MODEL}")
             
-            # Initialize the sentiment analysis pipeline
-            self.pipeline = pipeline(
-                "sentiment-analysis",
-                model=self.config.SENTIMENT_MODEL_NAME,
-                device=0 if torch.cuda.is_available() else -1  # Use GPU if available
-            )
-            logger.info(f"Successfully initialized sentiment analysis model: {self.config.SENTIMENT_MODEL_NAME}")
+            if use_cuda and _CFG.USE_ONNX_CUDA and os.path.isdir(_CFG.ONNX_MODEL_DIR):
+                # ONNX Runtime on the GPU, with inputs and outputs bound to device memory
+                self.pipeline = self._build_onnx_pipeline(
+                    _CFG.ONNX_MODEL_DIR,
+                    device=0,
+                    provider="CUDAExecutionProvider"
+                )
+                
+                # Initialize the CUDA provider now so the first real request doesn't stall
+                self.pipeline("warm up", truncation=True, max_length=512)
+            elif not use_cuda and os.path.isdir(_CFG.ONNX_QUANTIZED_MODEL_DIR):
+                # Prefer the INT8 ONNX Runtime export on CPU
+                self.pipeline = self._build_onnx_pipeline(
+                    _CFG.ONNX_QUANTIZED_MODEL_DIR,
+                    file_name="model_quantized.onnx"
+                )
+            else:
+                # Initialize the sentiment analysis pipeline
+                self.pipeline = pipeline(
+                    "sentiment-analysis",
+                    model=_MODEL,
+                    device=0 if use_cuda else -1,  # Use GPU if available
+                    batch_size=self.batch_size
+                )
+                
+                if use_cuda:
+                    # Half precision halves memory traffic and runs on tensor cores
+                    torch.set_float32_matmul_precision('high')
+                    self.pipeline.model.half()
+                elif _CFG.USE_IPEX:
+                    self._optimize_with_ipex()
+                
+                if _CFG.TORCH_COMPILE:
+                    self._compile_model()
+            logger.info(f"Successfully initialized sentiment analysis model: {_MODEL}")
             
         except Exception as e:
             logger.error(f"Failed to initialize sentiment analysis model: {str(e)}")
             raise Exception(f"Failed to initialize sentiment analysis model: {str(e)}")
     
+    def _build_onnx_pipeline(self, model_dir: str, device: int = -1, **model_kwargs):
+        """Build a pipeline over an exported ONNX Runtime model"""
+        from optimum.onnxruntime import ORTModelForSequenceClassification
+        import onnxruntime
+        
+        # Stay within the worker's thread budget (set on torch by worker_init)
+        # instead of ONNX Runtime's default of one thread per core
+        session_options = onnxruntime.SessionOptions()
+        session_options.intra_op_num_threads = torch.get_num_threads()
+        session_options.inter_op_num_threads = 1
+        
+        logger.info(f"Loading ONNX model from {model_dir}")
+        model = ORTModelForSequenceClassification.from_pretrained(model_dir, session_options=session_options, **model_kwargs)
+        tokenizer = AutoTokenizer.from_pretrained(_MODEL)
+        return pipeline("sentiment-analysis", model=model, tokenizer=tokenizer, device=device, batch_size=self.batch_size)
+    
+    def _optimize_with_ipex(self):
+        """Optimize the CPU model with Intel Extension for PyTorch in bfloat16"""
+        try:
+            import intel_extension_for_pytorch as ipex
+        except ImportError:
+            logger.warning("USE_IPEX is set but intel_extension_for_pytorch is not installed")
+            return
+        
+        logger.info("Optimizing sentiment analysis model with IPEX (bfloat16)")
+        self.pipeline.model = ipex.optimize(self.pipeline.model.eval(), dtype=torch.bfloat16, level="O1")
+        self.pipeline.model.register_forward_hook(_logits_to_float)
+        self.use_bf16 = True
+    
+    def _compile_model(self):
+        """Compile the PyTorch model and warm it up before serving requests"""
+        logger.info("Compiling sentiment analysis model with torch.compile")
+        self.pipeline.model = torch.compile(self.pipeline.model, mode="reduce-overhead", fullgraph=False)
+        
+        # Trigger compilation now so the first real request doesn't stall
+        with torch.inference_mode(), torch.autocast('cpu', dtype=torch.bfloat16, enabled=self.use_bf16):
+            self.pipeline("warm up " * 256, truncation=True, max_length=512)
+    
     def analyze_text(self, text: str) -> Tuple[str, float]:
         """Analyze sentiment of a single text and return (label, score)"""
         try:
             # Skip very short texts
             if len(text.strip()) < 3:
-                return "neutral", 0.5
+                return _NEUTRAL
             
-            # Run sentiment analysis
-            result = self.pipeline(text, truncation=True, max_length=512)
-            
-            # Extract label and score
-            label = result[0]['label'].lower()
-            score = result[0]['score']
-            
-            # Normalize labels to our expected format
-            if label in ['positive', 'pos']:
-                label = 'positive'
-            elif label in ['negative', 'neg']:
-                label = 'negative'
-            else:
-                label = 'neutral'
+            # Run sentiment analysis without autograd bookkeeping
+            with torch.inference_mode(), torch.autocast('cpu', dtype=torch.bfloat16, enabled=self.use_bf16):
+                result = self.pipeline(text, truncation=True, max_length=512)
             
-            return label, score
+            # Extract and normalize label and score
+            return _LABEL_MAP.get(result[0]['label'].lower(), 'neutral'), result[0]['score']
             
         except Exception as e:
             logger.error(f"Error analyzing text sentiment: {str(e)}")
             # Return neutral sentiment as fallback
-            return "neutral", 0.5
+            return _NEUTRAL
     
     def analyze_batch(self, texts: List[str]) -> List[Tuple[str, float]]:
         """Analyze sentiment of multiple texts"""
@@ -86,38 +164,75 @@ class MLSentimentService(SentimentService):
             if not texts:
                 return []
             
-            # Filter out very short texts
-            valid_texts = [text for text in texts if len(text.strip()) >= 3]
+            # Strip each text once: the result is both the length check and
+            # the cache key. Filter out very short texts, remembering where
+            # the rest came from
+            keys = [text.strip() for text in texts]
+            valid_indices = [i for i, key in enumerate(keys) if len(key) >= 3]
             
-            if not valid_texts:
-                return [("neutral", 0.5)] * len(texts)
+            if not valid_indices:
+                return [_NEUTRAL] * len(texts)
             
-            # Run batch sentiment analysis
-            results = self.pipeline(valid_texts, truncation=True, max_length=512)
-            
-            # Process results
-            processed_results = []
-            for result in results:
-                label = result['label'].lower()
-                score = result['score']
-                
-                # Normalize labels
-                if label in ['positive', 'pos']:
-                    label = 'positive'
-                elif label in ['negative', 'neg']:
-                    label = 'negative'
+            # Serve repeated texts from the cache and collect the unique misses
+            found = {}
+            pending = {}
+            for i in valid_indices:
+                key = keys[i]
+                if key in found or key in pending:
+                    continue
+                cached = self._cache.get(key)
+                if cached is not None:
+                    self._cache.move_to_end(key)
+                    found[key] = cached
                 else:
-                    label = 'neutral'
-                
-                processed_results.append((label, score))
+                    pending[key] = texts[i]
+            
+            if pending:
+                # Run batch sentiment analysis on length-sorted texts so each
+                # batch pads to a similar length; a generator input makes the
+                # pipeline stream batches instead of collecting every output
+                miss_keys = sorted(pending, key=lambda key: len(pending[key]))
+                with torch.inference_mode(), torch.autocast('cpu', dtype=torch.bfloat16, enabled=self.use_bf16):
+                    results = self.pipeline((pending[key] for key in miss_keys), truncation=True, max_length=512)
+                    for key, result in zip(miss_keys, results):
+                        found[key] = (_LABEL_MAP.get(result['label'].lower(), 'neutral'), result['score'])
+                        self._remember(key, found[key])
             
-            # Pad results if some texts were filtered out
-            while len(processed_results) < len(texts):
-                processed_results.append(("neutral", 0.5))
+            # Scatter results back to their input positions; filtered texts
+            # stay neutral
+            processed_results = [_NEUTRAL] * len(texts)
+            for i in valid_indices:
+                processed_results[i] = found[keys[i]]
             
             return processed_results
             
         except Exception as e:
             logger.error(f"Error in batch sentiment analysis: {str(e)}")
             # Return neutral sentiments as fallback
-            return [("neutral", 0.5)] * len(texts)
+            return [_NEUTRAL] * len(texts)
+    
+    def _remember(self, key: str, result: Tuple[str, float]) -> None:
+        """Add a result to the LRU cache, evicting the oldest entry when full"""
+        self._cache[key] = result
+        if len(self._cache) > _CACHE_SIZE:
+            self._cache.popitem(last=False)
+    
+    def analyze_batch_codes(self, texts: List[str]) -> Tuple[np.ndarray, np.ndarray]:
+        """Analyze multiple texts and return (uint8 label codes, float32 scores)"""
+        results = self.analyze_batch(texts)
+        labels = np.fromiter(
+            (SENTIMENT_LABEL_CODES[label] for label, _ in results),
+            dtype=np.uint8,
+            count=len(results)
+        )
+        scores = np.fromiter(
+            (score for _, score in results),
+            dtype=np.float32,
+            count=len(results)
+        )
+        return labels, scores
+
+@functools.lru_cache(maxsize=1)
+def get_sentiment_service() -> MLSentimentService:
+    """Return the process-wide sentiment service, loading the model on first use"""
+    return MLSentimentService()
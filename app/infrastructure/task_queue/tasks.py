@@ -1,11 +1,14 @@
+# Imported first so it can size the native thread pools before torch loads
+from . import worker_init  # registers the worker_process_init preload hook
 from celery import Celery
+from celery.signals import task_postrun, worker_process_init
 from typing import List
 import logging
 
 from ...domain.services import AnalysisOrchestrator
 from ...infrastructure.repositories.twitter_repository import TwitterRepositoryImpl
-from ...infrastructure.repositories.analysis_db_repository import AnalysisDBRepository
-from ...infrastructure.services.ml_sentiment_service import MLSentimentService
+from ...infrastructure.repositories.analysis_db_repository import AnalysisDBRepository, SessionLocal
+from ...infrastructure.services.ml_sentiment_service import get_sentiment_service
 from ...domain.models import AnalysisStatus
 from config import config
 
@@ -17,6 +20,41 @@ celery_app = Celery(
     broker=config['default'].CELERY_BROKER_URL,
     backend=config['default'].CELERY_RESULT_BACKEND
 )
+celery_app.conf.worker_concurrency = config['default'].CELERY_WORKER_CONCURRENCY
+
+# Repositories and orchestrator shared by all tasks in a worker process
+_ANALYSIS_REPO = None
+_ORCHESTRATOR = None
+
+@worker_process_init.connect
+def init_task_dependencies(**kwargs):
+    """Build the task collaborators once per worker process"""
+    global _ANALYSIS_REPO, _ORCHESTRATOR
+    
+    # The sentiment service is cached per process, so this won't reload the model
+    _ANALYSIS_REPO = AnalysisDBRepository()
+    _ORCHESTRATOR = AnalysisOrchestrator(
+        twitter_repo=TwitterRepositoryImpl(),
+        sentiment_service=get_sentiment_service(),
+        analysis_repo=_ANALYSIS_REPO
+    )
+
+def _get_orchestrator() -> AnalysisOrchestrator:
+    """Return the process orchestrator, building it for pools without worker_process_init"""
+    if _ORCHESTRATOR is None:
+        init_task_dependencies()
+    return _ORCHESTRATOR
+
+def _get_analysis_repo() -> AnalysisDBRepository:
+    """Return the process analysis repository"""
+    if _ANALYSIS_REPO is None:
+        init_task_dependencies()
+    return _ANALYSIS_REPO
+
+@task_postrun.connect
+def remove_db_session(**kwargs):
+    """Release the task's database session back to the pool"""
+    SessionLocal.remove()
 
 @celery_app.task(bind=True, name='analyze_topic_task')
 def analyze_topic_task(self, job_id: str, topic: str, max_tweets: int = 100):
@@ -24,21 +62,8 @@ def analyze_topic_task(self, job_id: str, topic: str, max_tweets: int = 100):
     try:
         logger.info(f"Starting analysis task for job {job_id}, topic: {topic}")
         
-        # Initialize repositories and services
-        # Note: MLSentimentService is now a singleton, so it won't reload the model
-        twitter_repo = TwitterRepositoryImpl()
-        sentiment_service = MLSentimentService()  # This will reuse existing instance
-        analysis_repo = AnalysisDBRepository()
-        
-        # Initialize orchestrator
-        orchestrator = AnalysisOrchestrator(
-            twitter_repo=twitter_repo,
-            sentiment_service=sentiment_service,
-            analysis_repo=analysis_repo
-        )
-        
         # Execute the analysis
-        success = orchestrator.execute_analysis(job_id, topic, max_tweets)
+        success = _get_orchestrator().execute_analysis(job_id, topic, max_tweets)
         
         if success:
             logger.info(f"Analysis completed successfully for job {job_id}")
@@ -60,8 +85,7 @@ def analyze_topic_task(self, job_id: str, topic: str, max_tweets: int = 100):
         
         # Update analysis status to failed
         try:
-            analysis_repo = AnalysisDBRepository()
-            analysis_repo.update_status(
+            _get_analysis_repo().update_status(
                 job_id, 
                 AnalysisStatus.FAILED.value, 
                 error_message=str(e)
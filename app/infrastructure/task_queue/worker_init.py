@@ -1,6 +1,20 @@
 """Worker initialization script to preload models and services"""
 import logging
-from .ml_sentiment_service import MLSentimentService
+import os
+from config import config
+
+# Split the CPU cores between worker processes instead of letting every
+# process spawn one thread per core; OpenMP/MKL only read these variables
+# when torch and numpy are first imported
+THREADS_PER_WORKER = max(1, (os.cpu_count() or 1) // config['default'].CELERY_WORKER_CONCURRENCY)
+os.environ.setdefault("OMP_NUM_THREADS", str(THREADS_PER_WORKER))
+os.environ.setdefault("MKL_NUM_THREADS", str(THREADS_PER_WORKER))
+# Rayon pool used by the Rust tokenizer
+os.environ.setdefault("RAYON_NUM_THREADS", str(THREADS_PER_WORKER))
+
+import torch
+from celery.signals import worker_process_init
+from ..services.ml_sentiment_service import get_sentiment_service
 
 logger = logging.getLogger(__name__)
 
@@ -9,9 +23,15 @@ def initialize_worker():
     try:
         logger.info("Initializing Celery worker...")
         
+        # Pin PyTorch's intra-op pool to this worker's share of the cores and
+        # run inter-op work inline
+        torch.set_num_threads(THREADS_PER_WORKER)
+        if torch.get_num_interop_threads() != 1:
+            torch.set_num_interop_threads(1)
+        
         # Preload the sentiment analysis model
         logger.info("Preloading sentiment analysis model...")
-        sentiment_service = MLSentimentService()
+        sentiment_service = get_sentiment_service()
         logger.info("Sentiment analysis model loaded successfully")
         
         # You can add other service initializations here
@@ -21,3 +41,8 @@ def initialize_worker():
     except Exception as e:
         logger.error(f"Failed to initialize Celery worker: {str(e)}")
         raise
+
+@worker_process_init.connect
+def preload_worker_process(**kwargs):
+    """Load models in each forked worker process before it accepts tasks"""
+    initialize_worker()
@@ -2,10 +2,9 @@
 
 from ..domain.models import AnalysisRequest
 from ..domain.services import AnalysisOrchestrator
-from ..infrastructure.repositories.twitter_repository import TwitterRepositoryImpl
-from ..infrastructure.repositories.analysis_db_repository import AnalysisDBRepository
-from ..infrastructure.services.ml_sentiment_service import MLSentimentService
+from ..domain.interfaces import TwitterRepository, SentimentService, AnalysisRepository
 from flask import current_app
+from typing import Optional
 import logging
 
 logger = logging.getLogger(__name__)
@@ -13,12 +12,16 @@ logger = logging.getLogger(__name__)
 class AnalyzeTopicUseCase:
     """Use case for analyzing sentiment of a topic"""
     
-    def __init__(self):
-        """Initialize use case with concrete implementations"""
-        # Initialize repositories and services
-        self.twitter_repo = TwitterRepositoryImpl()
-        self.sentiment_service = MLSentimentService()
-        self.analysis_repo = AnalysisDBRepository()
+    def __init__(
+        self,
+        twitter_repo: TwitterRepository,
+        sentiment_service: Optional[SentimentService],
+        analysis_repo: AnalysisRepository
+    ):
+        """Initialize use case with injected implementations; sentiment_service may be None where jobs only get queued"""
+        self.twitter_repo = twitter_repo
+        self.sentiment_service = sentiment_service
+        self.analysis_repo = analysis_repo
         
         # Initialize orchestrator
         self.orchestrator = AnalysisOrchestrator(
@@ -33,8 +36,7 @@ class AnalyzeTopicUseCase:
             # Create the analysis job in the database
             job_id = self.orchestrator.create_analysis_job(topic, max_tweets)
             
-            # Queue the background task using the Flask app's Celery instance
-            from ..infrastructure.task_queue.tasks import analyze_topic_task
+            # Queue the background task by name using the Flask app's Celery instance
             current_app.celery.send_task('analyze_topic_task', args=[job_id, topic, max_tweets])
             
             logger.info(f"Created analysis job {job_id} for topic: {topic}")
@@ -12,10 +12,17 @@ class Config:
     
     # Database Configuration
     DATABASE_URL = os.getenv('DATABASE_URL', 'postgresql://localhost/sentiment_analysis')
+    DB_POOL_SIZE = int(os.getenv('DB_POOL_SIZE', '20'))
+    DB_MAX_OVERFLOW = int(os.getenv('DB_MAX_OVERFLOW', '40'))
+    DB_POOL_RECYCLE = int(os.getenv('DB_POOL_RECYCLE', '1800'))
     
     # Redis Configuration
     REDIS_URL = os.getenv('REDIS_URL', 'redis://localhost:6379/0')
     
+    # Result Cache Configuration (completed/failed jobs only)
+    ANALYSIS_CACHE_TTL = int(os.getenv('ANALYSIS_CACHE_TTL', '3600'))
+    ANALYSIS_CACHE_SIZE = int(os.getenv('ANALYSIS_CACHE_SIZE', '4096'))
+    
     # Twitter API Configuration
     TWITTER_API_KEY = os.getenv('TWITTER_API_KEY')
     TWITTER_API_SECRET = os.getenv('TWITTER_API_SECRET')
@@ -26,10 +33,25 @@ class Config:
     # Celery Configuration
     CELERY_BROKER_URL = os.getenv('CELERY_BROKER_URL', REDIS_URL)
     CELERY_RESULT_BACKEND = os.getenv('CELERY_RESULT_BACKEND', REDIS_URL)
+    CELERY_WORKER_CONCURRENCY = int(os.getenv('CELERY_WORKER_CONCURRENCY', str(os.cpu_count() or 1)))
     
     # Application Configuration
     MAX_TWEETS_PER_ANALYSIS = int(os.getenv('MAX_TWEETS_PER_ANALYSIS', '100'))
     SENTIMENT_MODEL_NAME = os.getenv('SENTIMENT_MODEL_NAME', 'cardiffnlp/twitter-roberta-base-sentiment-latest')
+    # Full-precision ONNX export of the model (see download_model.py)
+    ONNX_MODEL_DIR = os.getenv('ONNX_MODEL_DIR', 'models/onnx')
+    # Serve the ONNX export with ONNX Runtime's CUDA provider instead of PyTorch on GPU
+    USE_ONNX_CUDA = os.getenv('USE_ONNX_CUDA', 'False').lower() in ('1', 'true')
+    # Dynamic INT8 ONNX export of the model, used on CPU when present (see download_model.py)
+    ONNX_QUANTIZED_MODEL_DIR = os.getenv('ONNX_QUANTIZED_MODEL_DIR', 'models/onnx-int8')
+    # Compile the PyTorch model with torch.compile at startup (slower cold start)
+    TORCH_COMPILE = os.getenv('TORCH_COMPILE', 'False').lower() in ('1', 'true')
+    # Optimize the CPU PyTorch model with Intel Extension for PyTorch in bfloat16
+    USE_IPEX = os.getenv('USE_IPEX', 'False').lower() in ('1', 'true')
+    # Texts per forward pass; 0 picks 32 on GPU and 8 on CPU
+    SENTIMENT_BATCH_SIZE = int(os.getenv('SENTIMENT_BATCH_SIZE', '0'))
+    # Sentiment results remembered per process for repeated tweet texts
+    SENTIMENT_CACHE_SIZE = int(os.getenv('SENTIMENT_CACHE_SIZE', '50000'))
 
 class DevelopmentConfig(Config):
     """Development configuration"""
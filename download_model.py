@@ -7,6 +7,10 @@ MODEL_NAME = os.getenv(
     'cardiffnlp/twitter-roberta-base-sentiment-latest'
 )
 
+# Where the ONNX exports are written, same as your app
+ONNX_MODEL_DIR = os.getenv('ONNX_MODEL_DIR', 'models/onnx')
+ONNX_QUANTIZED_MODEL_DIR = os.getenv('ONNX_QUANTIZED_MODEL_DIR', 'models/onnx-int8')
+
 def download_and_cache_model():
     """
     Downloads the specified Hugging Face model to the local cache.
@@ -25,5 +29,30 @@ def download_and_cache_model():
         print(f"\nAn error occurred during download: {e}")
         print("Please check your internet connection and try running the script again.")
 
+def export_onnx_models():
+    """
+    Exports the model to ONNX for GPU inference and applies dynamic INT8 quantization for CPU inference.
+    """
+    print(f"--- Exporting {MODEL_NAME} to ONNX: {ONNX_MODEL_DIR} (quantized: {ONNX_QUANTIZED_MODEL_DIR}) ---")
+
+    try:
+        from optimum.onnxruntime import ORTModelForSequenceClassification, ORTQuantizer
+        from optimum.onnxruntime.configuration import AutoQuantizationConfig
+
+        model = ORTModelForSequenceClassification.from_pretrained(MODEL_NAME, export=True)
+        model.save_pretrained(ONNX_MODEL_DIR)
+        quantizer = ORTQuantizer.from_pretrained(model)
+        quantizer.quantize(
+            save_dir=ONNX_QUANTIZED_MODEL_DIR,
+            quantization_config=AutoQuantizationConfig.avx512_vnni(is_static=False, per_channel=False)
+        )
+
+        print("\n--- ONNX models exported successfully! ---")
+
+    except Exception as e:
+        print(f"\nAn error occurred during ONNX export: {e}")
+        print("The service will fall back to the PyTorch model.")
+
 if __name__ == "__main__":
-    download_and_cache_model()
\ No newline at end of file
+    download_and_cache_model()
+    export_onnx_models()
\ No newline at end of file
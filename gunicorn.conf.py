@@ -0,0 +1,18 @@
+import multiprocessing
+import os
+
+# Plain prefork WSGI server; background work runs in Celery, so the API
+# doesn't need green threads
+bind = os.getenv('GUNICORN_BIND', '0.0.0.0:5000')
+worker_class = 'sync'
+workers = int(os.getenv('GUNICORN_WORKERS', multiprocessing.cpu_count()))
+timeout = int(os.getenv('GUNICORN_TIMEOUT', '120'))
+keepalive = 5
+accesslog = '-'
+errorlog = '-'
+
+
+def on_starting(server):
+    """Apply database migrations once in the master, before any worker boots"""
+    from app.infrastructure.repositories.analysis_db_repository import init_db
+    init_db()
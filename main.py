@@ -1,6 +1,3 @@
-import eventlet
-eventlet.monkey_patch()
-
 import os
 from flask import Flask
 from celery import Celery
@@ -31,10 +28,31 @@ def create_app(config_name=None):
     app = Flask(__name__)
     app.config.from_object(config[config_name])
     
+    # Serialize JSON responses with msgspec
+    from app.api.json_provider import MsgspecJSONProvider
+    app.json = MsgspecJSONProvider(app)
+    
     # Initialize extensions
     from app.api.routes import api_bp
     app.register_blueprint(api_bp, url_prefix='/api/v1')
     
+    # Share a single use case across requests; the API only creates and reads
+    # jobs, so the sentiment model is left to the Celery workers
+    from app.infrastructure.repositories.analysis_db_repository import AnalysisDBRepository, SessionLocal
+    from app.infrastructure.repositories.twitter_repository import TwitterRepositoryImpl
+    from app.use_cases.analyze_topic import AnalyzeTopicUseCase
+    
+    app.extensions['use_case'] = AnalyzeTopicUseCase(
+        twitter_repo=TwitterRepositoryImpl(),
+        sentiment_service=None,
+        analysis_repo=AnalysisDBRepository()
+    )
+    
+    # Release the request's database session
+    @app.teardown_appcontext
+    def remove_db_session(exception=None):
+        SessionLocal.remove()
+    
     # Create Celery instance
     celery = create_celery(app)
     app.celery = celery
@@ -45,4 +63,7 @@ def create_app(config_name=None):
 app = create_app()
 
 if __name__ == '__main__':
+    # Under Gunicorn this runs once in the master (see gunicorn.conf.py)
+    from app.infrastructure.repositories.analysis_db_repository import init_db
+    init_db()
     app.run(host='0.0.0.0', port=5000)
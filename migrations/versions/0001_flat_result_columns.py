@@ -0,0 +1,82 @@
+"""Flat result columns and active jobs index
+
+Creates the analyses table on a fresh database. On a database created by
+earlier releases (result_data JSONB blob, no ix_active_jobs), moves the
+results into typed columns, drops result_data and adds the partial index.
+
+Revision ID: 0001
+Revises:
+Create Date: 2026-10-15 00:00:00.000000
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+from sqlalchemy.dialects.postgresql import JSONB
+
+
+# revision identifiers, used by Alembic.
+revision: str = '0001'
+down_revision: Union[str, None] = None
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+RESULT_COLUMNS = (
+    ('positive_percentage', sa.Float),
+    ('negative_percentage', sa.Float),
+    ('neutral_percentage', sa.Float),
+    ('average_polarity', sa.Float),
+    ('total_tweets', sa.Integer),
+    ('analyzed_tweets', sa.Integer),
+)
+
+
+def upgrade() -> None:
+    inspector = sa.inspect(op.get_bind())
+
+    if not inspector.has_table('analyses'):
+        op.create_table(
+            'analyses',
+            sa.Column('job_id', sa.String(), primary_key=True),
+            sa.Column('topic', sa.String(), nullable=False),
+            sa.Column('status', sa.String(), nullable=False),
+            sa.Column('created_at', sa.DateTime(), nullable=True),
+            sa.Column('completed_at', sa.DateTime(), nullable=True),
+            sa.Column('error_message', sa.Text(), nullable=True),
+            *(sa.Column(name, type_(), nullable=True) for name, type_ in RESULT_COLUMNS)
+        )
+        op.create_index('ix_analyses_job_id', 'analyses', ['job_id'])
+    else:
+        columns = {column['name'] for column in inspector.get_columns('analyses')}
+        for name, type_ in RESULT_COLUMNS:
+            if name not in columns:
+                op.add_column('analyses', sa.Column(name, type_(), nullable=True))
+
+        if 'result_data' in columns:
+            op.execute(
+                "UPDATE analyses SET "
+                + ", ".join(
+                    f"{name} = (result_data->>'{name}')::{'double precision' if type_ is sa.Float else 'integer'}"
+                    for name, type_ in RESULT_COLUMNS
+                )
+                + " WHERE result_data IS NOT NULL"
+            )
+            op.drop_column('analyses', 'result_data')
+
+    op.execute(
+        "CREATE INDEX IF NOT EXISTS ix_active_jobs ON analyses (created_at) "
+        "WHERE status IN ('pending', 'processing')"
+    )
+
+
+def downgrade() -> None:
+    op.execute("DROP INDEX IF EXISTS ix_active_jobs")
+    op.add_column('analyses', sa.Column('result_data', JSONB(), nullable=True))
+    op.execute(
+        "UPDATE analyses SET result_data = jsonb_build_object("
+        + ", ".join(f"'{name}', {name}" for name, _ in RESULT_COLUMNS)
+        + ") WHERE total_tweets IS NOT NULL"
+    )
+    for name, _ in reversed(RESULT_COLUMNS):
+        op.drop_column('analyses', name)